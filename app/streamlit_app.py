@@ -12,8 +12,6 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import streamlit as st
-import pandas as pd
-import numpy as np
 from src.text_builder import user_to_text, property_to_text
 from src.embedder import TextEmbedder
 from src.similarity import compute_similarity
@@ -46,6 +44,33 @@ def load_embedder():
     return TextEmbedder(model_name=EMBEDDING_MODEL_NAME)
 
 
+@st.cache_data(show_spinner=False)
+def score_pair(user_text, property_text, budget, user_bedrooms, user_bathrooms,
+               price, property_bedrooms, property_bathrooms, living_area):
+    """Compute (match_score, numerical_score) for one user-property pair (cached per input)"""
+    embedder = load_embedder()
+    
+    # Encode both texts in a single forward pass
+    user_embedding, property_embedding = embedder.encode([user_text, property_text])
+    
+    user_row = {
+        "Budget": budget,
+        "Bedrooms": user_bedrooms,
+        "Bathrooms": user_bathrooms
+    }
+    
+    property_row = {
+        "Price": price,
+        "Bedrooms": property_bedrooms,
+        "Bathrooms": property_bathrooms,
+        "Living Area (sq ft)": living_area
+    }
+    
+    numerical_score = compute_numerical_similarity(user_row, property_row)
+    match_score = float(compute_similarity(user_embedding, property_embedding, numerical_score=numerical_score))
+    return match_score, numerical_score
+
+
 def get_score_color(score):
     """Return color class based on match score"""
     if score >= 75:
@@ -170,39 +195,34 @@ st.subheader("🔍 Real-Time Match Computation")
 if st.button("🎯 Compute Match Score", use_container_width=True, type="primary"):
     
     with st.spinner("⏳ Embedding text and computing similarity..."):
-        # Load embedder
-        embedder = load_embedder()
-        
         # Create text representations
-        user_row = {
+        user_text = user_to_text({
             "Budget": user_budget,
             "Bedrooms": user_bedrooms,
             "Bathrooms": user_bathrooms,
             "Qualitative Description": user_description
-        }
+        })
         
-        property_row = {
+        property_text = property_to_text({
             "Price": property_price,
             "Bedrooms": property_bedrooms,
             "Bathrooms": property_bathrooms,
             "Living Area (sq ft)": property_living_area,
             "Qualitative Description": property_description
-        }
-        
-        # Convert to text
-        user_series = pd.Series(user_row)
-        property_series = pd.Series(property_row)
-
-        user_text = user_to_text(user_series)
-        property_text = property_to_text(property_series)
-        
-        # Encode to embeddings
-        user_embedding = embedder.encode([user_text])[0]
-        property_embedding = embedder.encode([property_text])[0]
+        })
         
-        # Compute numerical + hybrid similarity
-        numerical_score = compute_numerical_similarity(user_series, property_series)
-        match_score = float(compute_similarity(user_embedding, property_embedding, numerical_score=numerical_score))
+        # Compute numerical + hybrid similarity (cached per input combination)
+        match_score, numerical_score = score_pair(
+            user_text,
+            property_text,
+            user_budget,
+            user_bedrooms,
+            user_bathrooms,
+            property_price,
+            property_bedrooms,
+            property_bathrooms,
+            property_living_area
+        )
         
         # Store in session state
         st.session_state.match_score = match_score
@@ -299,7 +319,7 @@ with st.sidebar:
     st.write("""
     - **Streamlit**: Interactive web UI
     - **Sentence Transformers**: Semantic embeddings
-    - **Scikit-learn**: Cosine similarity computation
+    - **NumPy**: Cosine similarity computation
     """)
 
 
@@ -6,15 +6,32 @@ semantic property matching system.
 """
 
 # Embedding model
-EMBEDDING_MODEL_NAME = "all-mpnet-base-v2"
+# all-MiniLM-L6-v2 (384-dim) is ~5x faster than all-mpnet-base-v2 (768-dim).
+# Cached embeddings are keyed by model name, so switching models never
+# reuses vectors of the wrong dimension.
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+HEAVY_EMBEDDING_MODEL_NAME = "all-mpnet-base-v2"
+EMBEDDING_BATCH_SIZE = 64
+EMBEDDING_HALF_PRECISION = True
+
+# Optional ONNX Runtime exports, one sub-directory per model name
+ONNX_MODEL_DIR = "onnx_model"
 
 # Data paths
 DATA_PATH = "data/raw/Case_Study_2_Data.xlsx"
 OUTPUT_DIR = "outputs"
+EMBEDDING_CACHE_PATH = "data/cache/embeddings.sqlite"
 
 # Matching configuration
 TOP_K = 5
 
+# Block sizes for all-pairs scoring (keeps each score tile cache-sized)
+USER_BLOCK_SIZE = 256
+PROPERTY_BLOCK_SIZE = 4096
+
+# Worker threads for scoring user blocks (-1 = all cores)
+N_JOBS = -1
+
 # Hybrid scoring weights
 SEMANTIC_WEIGHT = 0.7
 NUMERICAL_WEIGHT = 0.3
@@ -3,9 +3,31 @@ data_loader.py
 
 This module loads the raw Excel dataset and
 returns user and property data as pandas DataFrames.
+
+Each sheet is cached as a sibling Parquet file on first load,
+and later loads read the Parquet copy while it is newer than
+the Excel file.
 """
 
+import os
+
 import pandas as pd
+import pyarrow
+
+
+def _parquet_paths(file_path):
+    """
+    Return the Parquet cache paths for the user and property sheets.
+    """
+    base, _ = os.path.splitext(file_path)
+    return f"{base}.users.parquet", f"{base}.properties.parquet"
+
+
+def _is_fresh(cache_path, source_path):
+    return (
+        os.path.exists(cache_path)
+        and os.path.getmtime(cache_path) >= os.path.getmtime(source_path)
+    )
 
 
 def load_data(file_path):
@@ -20,11 +42,27 @@ def load_data(file_path):
         properties_df (pd.DataFrame): Property characteristics data
     """
 
-    # Read Excel file
-    excel_file = pd.ExcelFile(file_path)
+    users_path, properties_path = _parquet_paths(file_path)
+
+    # Read cached Parquet copies if they are up to date
+    if _is_fresh(users_path, file_path) and _is_fresh(properties_path, file_path):
+        return pd.read_parquet(users_path), pd.read_parquet(properties_path)
+
+    # Read all sheets in one pass with the Rust-backed calamine reader
+    sheets = list(pd.read_excel(file_path, sheet_name=None, engine="calamine").values())
+    users_df, properties_df = sheets[0], sheets[1]
 
-    # Load sheets
-    users_df = excel_file.parse(excel_file.sheet_names[0])
-    properties_df = excel_file.parse(excel_file.sheet_names[1])
+    # Cache sheets for later runs. Best effort: mixed-type columns cannot be
+    # written to Parquet and the data directory may be read-only, in which
+    # case the parsed sheets are returned uncached.
+    try:
+        users_df.to_parquet(users_path, compression="zstd")
+        properties_df.to_parquet(properties_path, compression="zstd")
+    except (pyarrow.ArrowException, OSError):
+        for path in (users_path, properties_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
 
     return users_df, properties_df
@@ -2,29 +2,167 @@
 embedder.py
 
 This module handles sentence embedding generation
-using a pre-trained SentenceTransformer model.
+using a pre-trained SentenceTransformer model, or an
+ONNX Runtime export of it when one is available.
 """
 
+import os
+from functools import lru_cache
+
+import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
-from src.config import EMBEDDING_MODEL_NAME
+from src.config import (
+    EMBEDDING_MODEL_NAME,
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_CACHE_PATH,
+    EMBEDDING_HALF_PRECISION,
+    ONNX_MODEL_DIR,
+)
+from src.embedding_cache import open_cache, get_or_compute
+
+
+def _cpu_supports_bf16():
+    """
+    Return True if the CPU has native BF16 matmul instructions (AVX-512 BF16 / AMX).
+    """
+    try:
+        with open("/proc/cpuinfo") as f:
+            flags = f.read()
+    except OSError:
+        return False
+    return "avx512_bf16" in flags or "amx_bf16" in flags
+
+
+def _load_onnx_model(path):
+    """
+    Load an ONNX feature-extraction export and its tokenizer.
+
+    Requires the optional optimum[onnxruntime] dependency.
+    """
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from transformers import AutoTokenizer
+
+    model = ORTModelForFeatureExtraction.from_pretrained(path, provider="CPUExecutionProvider")
+    tokenizer = AutoTokenizer.from_pretrained(path)
+    return model, tokenizer
 
 
 class TextEmbedder:
     """
     Wrapper class for sentence embedding model.
+
+    Embeddings are cached on disk (keyed by model name and text hash)
+    unless cache_path is None.
+
+    With half_precision enabled the model runs in FP16 on CUDA or BF16 on
+    CPUs with native support. Embeddings are cached as int8 and returned
+    as L2-normalized, contiguous float32 arrays, so cosine similarity is a
+    plain dot product. FP16 inference keeps cosine similarity within 1e-3
+    of FP32 (BF16 has a shorter mantissa and is less precise), and int8
+    storage within 1e-2.
+
+    If an ONNX export of the model exists under ONNX_MODEL_DIR/<model_name>,
+    it is run with ONNX Runtime (mean pooling + L2 normalization, as in the
+    sentence-transformers pipeline) instead of PyTorch.
     """
 
-    def __init__(self, model_name=EMBEDDING_MODEL_NAME):
-        self.model = SentenceTransformer(model_name)
+    def __init__(
+        self,
+        model_name=EMBEDDING_MODEL_NAME,
+        device="cpu",
+        cache_path=EMBEDDING_CACHE_PATH,
+        half_precision=EMBEDDING_HALF_PRECISION,
+    ):
+        self.model_name = model_name
+        self.model = None
+        self.onnx_model = None
+
+        onnx_path = os.path.join(ONNX_MODEL_DIR, model_name)
+        if os.path.isdir(onnx_path):
+            self.onnx_model, self.tokenizer = _load_onnx_model(onnx_path)
+        else:
+            self.model = SentenceTransformer(model_name, device=device)
+            if half_precision:
+                if device.startswith("cuda"):
+                    self.model.half()
+                elif _cpu_supports_bf16():
+                    self.model = self.model.to(torch.bfloat16)
+        self.cache = open_cache(cache_path) if cache_path else None
 
-    def encode(self, texts):
+    def encode(self, texts, batch_size=EMBEDDING_BATCH_SIZE):
         """
-        Generate embeddings for a list of texts.
+        Generate L2-normalized embeddings for a list of texts.
 
         Parameters:
             texts (list[str]): List of text strings
+            batch_size (int): Number of texts per forward pass
 
         Returns:
-            numpy.ndarray: Array of embeddings
+            numpy.ndarray: Contiguous float32 array of unit-length embeddings
         """
-        return self.model.encode(texts, show_progress_bar=True)
+
+        def encode_batch(batch):
+            if self.onnx_model is not None:
+                return self._encode_onnx(batch, batch_size)
+            if not len(batch):
+                return np.empty((0, 0), dtype=np.float32)
+            # Upcast as a tensor: NumPy has no bfloat16, and older
+            # sentence-transformers cannot convert BF16 outputs themselves.
+            # Re-normalize after the upcast, since BF16 norms are only
+            # accurate to a few 1e-3
+            embeddings = self.model.encode(
+                batch,
+                batch_size=batch_size,
+                convert_to_tensor=True,
+                normalize_embeddings=True,
+                show_progress_bar=False,
+            )
+            embeddings = embeddings.float().cpu().numpy()
+            embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+            return embeddings
+
+        if self.cache is None:
+            embeddings = encode_batch(texts)
+        else:
+            embeddings = get_or_compute(texts, self.model_name, encode_batch, self.cache)
+
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
+
+    def _encode_onnx(self, texts, batch_size):
+        """
+        Tokenize, run the ONNX model, mean-pool and L2-normalize.
+        """
+        embeddings = []
+        for start in range(0, len(texts), batch_size):
+            inputs = self.tokenizer(
+                list(texts[start:start + batch_size]),
+                padding=True,
+                truncation=True,
+                return_tensors="np",
+            )
+            hidden = np.asarray(self.onnx_model(**inputs).last_hidden_state, dtype=np.float32)
+
+            # Mean pooling over non-padding tokens
+            mask = inputs["attention_mask"][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+            embeddings.append(pooled)
+
+        if not embeddings:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.vstack(embeddings)
+
+
+@lru_cache(maxsize=4)
+def get_embedder(model_name=EMBEDDING_MODEL_NAME):
+    """
+    Return a shared TextEmbedder for the given model, loading it on first use.
+
+    Parameters:
+        model_name (str): Name of the SentenceTransformer model
+
+    Returns:
+        TextEmbedder: Cached embedder instance
+    """
+    return TextEmbedder(model_name=model_name)
@@ -0,0 +1,158 @@
+"""
+embedding_cache.py
+
+This module provides a SQLite-backed cache of sentence embeddings
+keyed by model name and a hash of the input text, so unchanged
+texts are never re-embedded.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+
+import numpy as np
+
+from src.config import EMBEDDING_CACHE_PATH
+
+# SQLite limits the number of bound parameters per statement
+_QUERY_CHUNK_SIZE = 500
+
+# Vectors are stored as int8 with a per-vector scale (~4x smaller than float32)
+_TABLE = "embeddings_q8"
+
+
+def quantize(vector):
+    """
+    Quantize an embedding to int8 with a symmetric per-vector scale.
+
+    Returns:
+        tuple[np.ndarray, float]: int8 vector and scale (vector ~= q / scale)
+    """
+    vector = np.asarray(vector, dtype=np.float32)
+    max_abs = float(np.max(np.abs(vector))) if vector.size else 0.0
+    scale = 127.0 / max_abs if max_abs > 0 else 1.0
+    return np.round(vector * scale).astype(np.int8), scale
+
+
+def dequantize(q, scale):
+    """
+    Reconstruct a float32 embedding from its int8 form.
+    """
+    return q.astype(np.float32) / np.float32(scale)
+
+
+class _CacheConnection(sqlite3.Connection):
+    """
+    SQLite connection carrying a lock that serializes its use across threads.
+
+    The cache connection may be shared between threads (e.g. Streamlit
+    sessions), which sqlite3 does not make safe on its own.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+
+
+def open_cache(path=EMBEDDING_CACHE_PATH):
+    """
+    Open (and create if needed) the embedding cache database.
+
+    The connection can be shared between threads; get_or_compute holds its
+    lock while reading or writing.
+
+    Parameters:
+        path (str): Path to the SQLite database file
+
+    Returns:
+        sqlite3.Connection: Open cache connection
+    """
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    conn = sqlite3.connect(path, check_same_thread=False, factory=_CacheConnection)
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {_TABLE} ("
+        " model TEXT NOT NULL,"
+        " text_hash BLOB NOT NULL,"
+        " dim INTEGER NOT NULL,"
+        " scale REAL NOT NULL,"
+        " vec BLOB NOT NULL,"
+        " PRIMARY KEY (model, text_hash))"
+    )
+    conn.commit()
+    return conn
+
+
+def _text_hash(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def _fetch(conn, model_name, hashes):
+    found = {}
+    for start in range(0, len(hashes), _QUERY_CHUNK_SIZE):
+        chunk = hashes[start:start + _QUERY_CHUNK_SIZE]
+        placeholders = ",".join("?" * len(chunk))
+        rows = conn.execute(
+            f"SELECT text_hash, scale, vec FROM {_TABLE} "
+            f"WHERE model = ? AND text_hash IN ({placeholders})",
+            [model_name, *chunk],
+        )
+        for text_hash, scale, vec in rows:
+            found[text_hash] = dequantize(np.frombuffer(vec, dtype=np.int8), scale)
+    return found
+
+
+def get_or_compute(texts, model_name, encode_fn, conn):
+    """
+    Return embeddings for texts, computing only the ones not yet cached.
+
+    Fresh embeddings go through the same int8 round trip as cached ones, so
+    results do not depend on whether a text was already in the cache. The
+    connection lock is held for the lookup and the insert, but not while
+    encoding.
+
+    Parameters:
+        texts (list[str]): List of text strings
+        model_name (str): Name of the embedding model (part of the cache key)
+        encode_fn (callable): Function mapping a list of texts to an embedding array
+        conn (sqlite3.Connection): Open cache connection from open_cache
+
+    Returns:
+        numpy.ndarray: float32 array of embeddings in the same order as texts
+    """
+
+    texts = list(texts)
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)
+
+    hashes = [_text_hash(text) for text in texts]
+    unique_hashes = list(dict.fromkeys(hashes))
+    with conn.lock:
+        found = _fetch(conn, model_name, unique_hashes)
+
+    # ---- Encode cache misses in a single batch ----
+    miss_texts = {}
+    for text_hash, text in zip(hashes, texts):
+        if text_hash not in found and text_hash not in miss_texts:
+            miss_texts[text_hash] = text
+
+    if miss_texts:
+        vectors = np.asarray(encode_fn(list(miss_texts.values())), dtype=np.float32)
+        rows = []
+        for text_hash, vector in zip(miss_texts, vectors):
+            q, scale = quantize(vector)
+            found[text_hash] = dequantize(q, scale)
+            rows.append((model_name, text_hash, q.shape[0], scale, q.tobytes()))
+
+        with conn.lock, conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {_TABLE} (model, text_hash, dim, scale, vec) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    return np.stack([found[text_hash] for text_hash in hashes])
@@ -1,11 +1,16 @@
 """
 feature_encoder.py
 
-Compute numerical similarity scores between user preferences and property features.
+Compute numerical similarity scores between user preferences and property features,
+either for a single user-property pair or for all pairs at once.
 """
 
 import math
 
+import numpy as np
+import pandas as pd
+from numba import njit
+
 from src.config import (
     BUDGET_TOLERANCE,
     BEDROOM_FLEX,
@@ -41,10 +46,20 @@ def _get_value(row, key):
     return _safe_float(value)
 
 
+def _param(value):
+    return math.nan if value is None else float(value)
+
+
+# fastmath without the no-NaN/no-Inf assumptions, which would let LLVM
+# drop the isnan checks that mark missing features
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@njit(cache=True, fastmath=_FASTMATH)
 def _tolerance_score(target, actual, tolerance):
-    if target is None or actual is None:
-        return None
-    if tolerance is None or tolerance <= 0:
+    if math.isnan(target) or math.isnan(actual):
+        return math.nan
+    if not tolerance > 0:
         return 1.0 if target == actual else 0.0
     if target == 0:
         return 1.0 if actual == 0 else 0.0
@@ -55,17 +70,59 @@ def _tolerance_score(target, actual, tolerance):
     return max(0.0, 1.0 - (diff_ratio / tolerance))
 
 
-def _flex_match_score(preferred, actual, flexibility, near_score=0.7):
-    if preferred is None or actual is None:
-        return None
+@njit(cache=True, fastmath=_FASTMATH)
+def _flex_match_score(preferred, actual, flexibility, near_score):
+    if math.isnan(preferred) or math.isnan(actual):
+        return math.nan
     diff = abs(actual - preferred)
     if diff == 0:
         return 1.0
-    if flexibility is not None and diff <= flexibility:
-        return float(near_score)
+    if diff <= flexibility:
+        return near_score
     return 0.0
 
 
+@njit(cache=True, fastmath=_FASTMATH)
+def _numerical_score_core(
+    budget,
+    price,
+    user_bedrooms,
+    property_bedrooms,
+    user_bathrooms,
+    property_bathrooms,
+    user_living_area,
+    property_living_area,
+    budget_tolerance,
+    bedroom_flex,
+    bathroom_flex,
+    living_area_tolerance,
+):
+    """
+    Average the available feature scores (0-1) for one user-property pair.
+
+    All arguments are floats; NaN marks a missing value or an unset
+    tolerance/flexibility. Returns NaN if no feature could be compared.
+    """
+
+    feature_scores = (
+        _tolerance_score(budget, price, budget_tolerance),
+        _flex_match_score(user_bedrooms, property_bedrooms, bedroom_flex, 0.7),
+        _flex_match_score(user_bathrooms, property_bathrooms, bathroom_flex, 0.7),
+        _tolerance_score(user_living_area, property_living_area, living_area_tolerance),
+    )
+
+    total = 0.0
+    count = 0
+    for score in feature_scores:
+        if not math.isnan(score):
+            total += score
+            count += 1
+
+    if count == 0:
+        return math.nan
+    return total / count
+
+
 def compute_numerical_similarity(
     user_row,
     property_row,
@@ -84,37 +141,149 @@ def compute_numerical_similarity(
         - Living area (within tolerance, if user preference exists)
     """
 
-    scores = []
-
-    # Budget vs Price
-    budget = _get_value(user_row, "Budget")
-    price = _get_value(property_row, "Price")
-    score = _tolerance_score(budget, price, budget_tolerance)
-    if score is not None:
-        scores.append(score)
-
-    # Bedrooms
-    user_bedrooms = _get_value(user_row, "Bedrooms")
-    property_bedrooms = _get_value(property_row, "Bedrooms")
-    score = _flex_match_score(user_bedrooms, property_bedrooms, bedroom_flex)
-    if score is not None:
-        scores.append(score)
-
-    # Bathrooms
-    user_bathrooms = _get_value(user_row, "Bathrooms")
-    property_bathrooms = _get_value(property_row, "Bathrooms")
-    score = _flex_match_score(user_bathrooms, property_bathrooms, bathroom_flex)
-    if score is not None:
-        scores.append(score)
-
-    # Living area (only if user preference exists)
-    user_living_area = _get_value(user_row, "Living Area (sq ft)")
-    property_living_area = _get_value(property_row, "Living Area (sq ft)")
-    score = _tolerance_score(user_living_area, property_living_area, living_area_tolerance)
-    if score is not None:
-        scores.append(score)
-
-    if not scores:
+    score = _numerical_score_core(
+        _param(_get_value(user_row, "Budget")),
+        _param(_get_value(property_row, "Price")),
+        _param(_get_value(user_row, "Bedrooms")),
+        _param(_get_value(property_row, "Bedrooms")),
+        _param(_get_value(user_row, "Bathrooms")),
+        _param(_get_value(property_row, "Bathrooms")),
+        _param(_get_value(user_row, "Living Area (sq ft)")),
+        _param(_get_value(property_row, "Living Area (sq ft)")),
+        _param(budget_tolerance),
+        _param(bedroom_flex),
+        _param(bathroom_flex),
+        _param(living_area_tolerance),
+    )
+
+    if math.isnan(score):
         return None
 
-    return round((sum(scores) / len(scores)) * 100, 2)
+    return round(score * 100, 2)
+
+
+# Columns compared feature by feature, in the same order for users and properties
+USER_FEATURE_COLUMNS = ("Budget", "Bedrooms", "Bathrooms", "Living Area (sq ft)")
+PROPERTY_FEATURE_COLUMNS = ("Price", "Bedrooms", "Bathrooms", "Living Area (sq ft)")
+
+
+def _get_column(df, key):
+    if key not in df.columns:
+        return np.full(len(df), np.nan)
+    return pd.to_numeric(df[key], errors="coerce").to_numpy(dtype=float)
+
+
+def extract_features(df, columns):
+    """
+    Extract numeric feature columns as a float matrix.
+
+    Missing columns and non-numeric values become NaN.
+
+    Parameters:
+        df (pd.DataFrame): User or property dataframe
+        columns (tuple[str]): USER_FEATURE_COLUMNS or PROPERTY_FEATURE_COLUMNS
+
+    Returns:
+        np.ndarray: Features of shape (n_rows, len(columns))
+    """
+    return np.column_stack([_get_column(df, column) for column in columns])
+
+
+def _tolerance_score_matrix(target, actual, tolerance):
+    target = target[:, None]
+    actual = actual[None, :]
+    missing = np.isnan(target) | np.isnan(actual)
+
+    if tolerance is None or tolerance <= 0:
+        scores = (target == actual).astype(float)
+    else:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            diff_ratio = np.abs(actual - target) / target
+            scores = np.where(diff_ratio >= tolerance, 0.0, np.maximum(0.0, 1.0 - diff_ratio / tolerance))
+        scores = np.where(target == 0, (actual == 0).astype(float), scores)
+
+    return np.where(missing, np.nan, scores)
+
+
+def _flex_match_score_matrix(preferred, actual, flexibility, near_score=0.7):
+    diff = np.abs(actual[None, :] - preferred[:, None])
+    if flexibility is not None:
+        scores = np.where(diff <= flexibility, float(near_score), 0.0)
+    else:
+        scores = np.zeros_like(diff)
+    scores = np.where(diff == 0, 1.0, scores)
+    return np.where(np.isnan(diff), np.nan, scores)
+
+
+def compute_numerical_similarity_block(
+    user_features,
+    property_features,
+    budget_tolerance=BUDGET_TOLERANCE,
+    bedroom_flex=BEDROOM_FLEX,
+    bathroom_flex=BATHROOM_FLEX,
+    living_area_tolerance=LIVING_AREA_TOLERANCE,
+):
+    """
+    Compute numerical similarity scores (0-100) between blocks of pre-extracted features.
+
+    Vectorized equivalent of compute_numerical_similarity: each feature is
+    scored for all pairs with broadcasted NumPy operations and the available
+    feature scores are averaged per pair.
+
+    Parameters:
+        user_features (np.ndarray): Output of extract_features for users
+        property_features (np.ndarray): Output of extract_features for properties
+
+    Returns:
+        np.ndarray: Scores of shape (n_users, n_properties), NaN where
+            no feature could be compared
+    """
+
+    feature_scores = np.stack([
+        # Budget vs Price
+        _tolerance_score_matrix(user_features[:, 0], property_features[:, 0], budget_tolerance),
+        # Bedrooms
+        _flex_match_score_matrix(user_features[:, 1], property_features[:, 1], bedroom_flex),
+        # Bathrooms
+        _flex_match_score_matrix(user_features[:, 2], property_features[:, 2], bathroom_flex),
+        # Living area (only if user preference exists)
+        _tolerance_score_matrix(user_features[:, 3], property_features[:, 3], living_area_tolerance),
+    ])
+
+    counts = np.sum(~np.isnan(feature_scores), axis=0)
+    totals = np.nansum(feature_scores, axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = np.where(counts > 0, totals / counts, np.nan)
+
+    return np.round(scores * 100, 2)
+
+
+def compute_numerical_similarity_matrix(
+    users_df,
+    properties_df,
+    budget_tolerance=BUDGET_TOLERANCE,
+    bedroom_flex=BEDROOM_FLEX,
+    bathroom_flex=BATHROOM_FLEX,
+    living_area_tolerance=LIVING_AREA_TOLERANCE,
+):
+    """
+    Compute numerical similarity scores (0-100) for every user-property pair.
+
+    Parameters:
+        users_df (pd.DataFrame): User preferences dataframe
+        properties_df (pd.DataFrame): Property characteristics dataframe
+
+    Returns:
+        np.ndarray: Scores of shape (n_users, n_properties), NaN where
+            no feature could be compared
+    """
+
+    return compute_numerical_similarity_block(
+        extract_features(users_df, USER_FEATURE_COLUMNS),
+        extract_features(properties_df, PROPERTY_FEATURE_COLUMNS),
+        budget_tolerance=budget_tolerance,
+        bedroom_flex=bedroom_flex,
+        bathroom_flex=bathroom_flex,
+        living_area_tolerance=living_area_tolerance,
+    )
@@ -5,19 +5,113 @@ This module computes match scores between all
 user-property pairs and ranks properties per user.
 """
 
+import numpy as np
 import pandas as pd
+from joblib import Parallel, cpu_count, delayed, effective_n_jobs
+from threadpoolctl import threadpool_limits
+
+from src.text_builder import users_to_texts, properties_to_texts
+from src.embedder import get_embedder
+from src.similarity import compute_similarity_matrix
+from src.feature_encoder import (
+    USER_FEATURE_COLUMNS,
+    PROPERTY_FEATURE_COLUMNS,
+    extract_features,
+    compute_numerical_similarity_block,
+)
+from src.config import (
+    EMBEDDING_MODEL_NAME,
+    N_JOBS,
+    USER_ID_COL,
+    PROPERTY_ID_COL,
+    PROPERTY_BLOCK_SIZE,
+    USER_BLOCK_SIZE,
+)
+
+
+def _top_k(scores, k):
+    """
+    Select the k highest scores in each row, sorted in descending order.
+
+    Uses argpartition so only the k selected scores per row are sorted.
+
+    Parameters:
+        scores (np.ndarray): Score matrix of shape (n_rows, n_cols)
+        k (int): Number of scores to keep per row
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Column indices and scores, shape (n_rows, k)
+    """
+
+    if k <= 0:
+        empty = np.empty((scores.shape[0], 0), dtype=np.intp)
+        return empty, np.take_along_axis(scores, empty, axis=1)
 
-from src.text_builder import user_to_text, property_to_text
-from src.embedder import TextEmbedder
-from src.similarity import compute_similarity
-from src.feature_encoder import compute_numerical_similarity
-from src.config import USER_ID_COL, PROPERTY_ID_COL
+    top_idx = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(scores, top_idx, axis=1)
+
+    order = np.argsort(-top_scores, axis=1, kind="stable")
+    top_idx = np.take_along_axis(top_idx, order, axis=1)
+    top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+    return top_idx, top_scores
+
+
+def _match_user_block(
+    user_embeddings,
+    user_features,
+    property_embeddings,
+    property_features,
+    k,
+    property_block_size=PROPERTY_BLOCK_SIZE,
+):
+    """
+    Find the top-k properties for a block of users.
+
+    Properties are scored one tile at a time and each tile's top-k is merged
+    into a running top-k, so the full score matrix is never materialized.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Property indices and scores, shape (n_users, k)
+    """
+
+    n_users = len(user_embeddings)
+    best_idx = np.empty((n_users, 0), dtype=np.intp)
+    best_scores = np.empty((n_users, 0))
+
+    for p0 in range(0, len(property_embeddings), property_block_size):
+        p1 = p0 + property_block_size
+
+        numerical_scores = compute_numerical_similarity_block(
+            user_features,
+            property_features[p0:p1]
+        )
+        scores = compute_similarity_matrix(
+            user_embeddings,
+            property_embeddings[p0:p1],
+            numerical_scores=numerical_scores
+        )
+
+        tile_idx, tile_scores = _top_k(scores, min(k, scores.shape[1]))
+
+        # ---- Merge with the running top-k ----
+        candidate_idx = np.hstack([best_idx, tile_idx + p0])
+        candidate_scores = np.hstack([best_scores, tile_scores])
+        order, best_scores = _top_k(candidate_scores, min(k, candidate_scores.shape[1]))
+        best_idx = np.take_along_axis(candidate_idx, order, axis=1)
+
+    return best_idx, best_scores
 
 
 def compute_all_matches(users_df, properties_df, top_k=5):
     """
     Compute match scores for all user-property pairs.
 
+    Users and properties are processed in blocks of USER_BLOCK_SIZE x
+    PROPERTY_BLOCK_SIZE so only one score tile per worker is in memory at
+    a time. User blocks are scored concurrently on up to N_JOBS threads, and
+    the cores are split evenly between them for BLAS.
+
     Parameters:
         users_df (pd.DataFrame): User preferences dataframe
         properties_df (pd.DataFrame): Property characteristics dataframe
@@ -27,49 +121,54 @@ def compute_all_matches(users_df, properties_df, top_k=5):
         pd.DataFrame: Ranked match scores
     """
 
-    embedder = TextEmbedder()
+    embedder = get_embedder(EMBEDDING_MODEL_NAME)
 
     # ---- Convert users to text ----
-    user_texts = users_df.apply(user_to_text, axis=1).tolist()
+    user_texts = users_to_texts(users_df)
     user_embeddings = embedder.encode(user_texts)
 
     # ---- Convert properties to text ----
-    property_texts = properties_df.apply(property_to_text, axis=1).tolist()
+    property_texts = properties_to_texts(properties_df)
     property_embeddings = embedder.encode(property_texts)
 
-    results = []
-
-    # ---- Compute similarity for each user-property pair ----
-    for user_idx, user_embedding in enumerate(user_embeddings):
-        user_row = users_df.iloc[user_idx]
-        user_id = user_row[USER_ID_COL]
-
-        for prop_idx, prop_embedding in enumerate(property_embeddings):
-            property_row = properties_df.iloc[prop_idx]
-            property_id = property_row[PROPERTY_ID_COL]
-
-            numerical_score = compute_numerical_similarity(user_row, property_row)
-            score = compute_similarity(
-                user_embedding,
-                prop_embedding,
-                numerical_score=numerical_score
+    user_features = extract_features(users_df, USER_FEATURE_COLUMNS)
+    property_features = extract_features(properties_df, PROPERTY_FEATURE_COLUMNS)
+
+    # ---- Hybrid similarity + top-k, user blocks in parallel ----
+    k = min(top_k, len(properties_df))
+    top_idx = np.empty((0, k), dtype=np.intp)
+    top_scores = np.empty((0, k))
+
+    # No more workers than blocks; the cores are split between the workers'
+    # BLAS calls so they do not oversubscribe, and a single worker keeps BLAS
+    # at its default thread count
+    n_blocks = -(-len(users_df) // USER_BLOCK_SIZE)
+    n_jobs = max(1, min(effective_n_jobs(N_JOBS), n_blocks))
+    blas_threads = max(1, cpu_count() // n_jobs) if n_jobs > 1 else None
+    with threadpool_limits(limits=blas_threads, user_api="blas"):
+        blocks = Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(_match_user_block)(
+                user_embeddings[u0:u0 + USER_BLOCK_SIZE],
+                user_features[u0:u0 + USER_BLOCK_SIZE],
+                property_embeddings,
+                property_features,
+                k
             )
-
-            results.append({
-                "user_id": user_id,
-                "property_id": property_id,
-                "match_score": score
-            })
-
-    results_df = pd.DataFrame(results)
+            for u0 in range(0, len(users_df), USER_BLOCK_SIZE)
+        )
+    if blocks:
+        top_idx = np.vstack([block_idx for block_idx, _ in blocks])
+        top_scores = np.vstack([block_scores for _, block_scores in blocks])
 
     # ---- Rank properties per user ----
-    results_df = (
-        results_df
-        .sort_values(["user_id", "match_score"], ascending=[True, False])
-        .groupby("user_id")
-        .head(top_k)
-        .reset_index(drop=True)
-    )
+    user_ids = users_df[USER_ID_COL].to_numpy()
+    property_ids = properties_df[PROPERTY_ID_COL].to_numpy()
+    user_order = np.argsort(user_ids, kind="stable")
+
+    results_df = pd.DataFrame({
+        "user_id": np.repeat(user_ids[user_order], k),
+        "property_id": property_ids[top_idx[user_order]].reshape(-1),
+        "match_score": top_scores[user_order].reshape(-1)
+    })
 
     return results_df
@@ -6,7 +6,6 @@ user and property embeddings.
 """
 
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 
 from src.config import SEMANTIC_WEIGHT, NUMERICAL_WEIGHT
 
@@ -22,6 +21,9 @@ def compute_similarity(
     Compute semantic similarity between two embeddings and optionally combine
     with a numerical similarity score using weighted hybrid scoring.
 
+    Embeddings are expected to be L2-normalized (as returned by TextEmbedder),
+    so cosine similarity is their dot product.
+
     Parameters:
         user_embedding (np.ndarray): User embedding vector
         property_embedding (np.ndarray): Property embedding vector
@@ -33,12 +35,11 @@ def compute_similarity(
         float: Match score between 0 and 100
     """
 
-    # Ensure correct shape
-    user_embedding = np.array(user_embedding).reshape(1, -1)
-    property_embedding = np.array(property_embedding).reshape(1, -1)
+    user_embedding = np.asarray(user_embedding, dtype=np.float32).ravel()
+    property_embedding = np.asarray(property_embedding, dtype=np.float32).ravel()
 
-    # Cosine similarity
-    semantic_similarity = cosine_similarity(user_embedding, property_embedding)[0][0]
+    # Cosine similarity of unit vectors
+    semantic_similarity = float(user_embedding @ property_embedding)
 
     # Normalize to 0-100
     semantic_score = round(semantic_similarity * 100, 2)
@@ -52,3 +53,50 @@ def compute_similarity(
 
     hybrid_score = (semantic_score * semantic_weight + numerical_score * numerical_weight) / total_weight
     return round(hybrid_score, 2)
+
+
+def compute_similarity_matrix(
+    user_embeddings,
+    property_embeddings,
+    numerical_scores=None,
+    semantic_weight=SEMANTIC_WEIGHT,
+    numerical_weight=NUMERICAL_WEIGHT,
+):
+    """
+    Compute hybrid match scores for every user-property pair at once.
+
+    Embeddings are expected to be L2-normalized (as returned by TextEmbedder),
+    so the full cosine similarity matrix is a single matrix multiplication.
+
+    Parameters:
+        user_embeddings (np.ndarray): User embeddings, shape (n_users, dim)
+        property_embeddings (np.ndarray): Property embeddings, shape (n_properties, dim)
+        numerical_scores (np.ndarray | None): Numerical similarity scores (0-100),
+            shape (n_users, n_properties); NaN where no score is available
+        semantic_weight (float): Weight for semantic similarity
+        numerical_weight (float): Weight for numerical similarity
+
+    Returns:
+        np.ndarray: Match scores between 0 and 100, shape (n_users, n_properties)
+    """
+
+    user_embeddings = np.ascontiguousarray(user_embeddings, dtype=np.float32)
+    property_embeddings = np.ascontiguousarray(property_embeddings, dtype=np.float32)
+
+    # Cosine similarity normalized to 0-100
+    semantic_similarity = (user_embeddings @ property_embeddings.T).astype(np.float64)
+    semantic_scores = np.round(semantic_similarity * 100.0, 2)
+
+    if numerical_scores is None:
+        return semantic_scores
+
+    total_weight = semantic_weight + numerical_weight
+    if total_weight <= 0:
+        return semantic_scores
+
+    numerical_scores = np.asarray(numerical_scores, dtype=np.float64)
+    hybrid_scores = (semantic_scores * semantic_weight + numerical_scores * numerical_weight) / total_weight
+
+    # Fall back to the semantic score where no numerical score exists
+    hybrid_scores = np.where(np.isnan(numerical_scores), semantic_scores, hybrid_scores)
+    return np.round(hybrid_scores, 2)
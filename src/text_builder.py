@@ -6,6 +6,19 @@ into clean natural-language text representations suitable
 for sentence embeddings.
 """
 
+USER_FMT = (
+    "User is looking for a home with a budget of {budget} dollars, "
+    "{bedrooms} bedrooms and {bathrooms} bathrooms. "
+    "Preferences: {description}"
+)
+
+PROPERTY_FMT = (
+    "This property is priced at {price} dollars, "
+    "has {bedrooms} bedrooms and {bathrooms} bathrooms, "
+    "with a living area of {living_area} square feet. "
+    "Property description: {description}"
+)
+
 
 def user_to_text(user_row):
     """
@@ -18,19 +31,13 @@ def user_to_text(user_row):
         str: Text representation of user preferences
     """
 
-    budget = user_row["Budget"]
-    bedrooms = user_row["Bedrooms"]
-    bathrooms = user_row["Bathrooms"]
-    description = user_row["Qualitative Description"]
-
-    user_text = (
-        f"User is looking for a home with a budget of {budget} dollars, "
-        f"{bedrooms} bedrooms and {bathrooms} bathrooms. "
-        f"Preferences: {description}"
+    return USER_FMT.format(
+        budget=user_row["Budget"],
+        bedrooms=user_row["Bedrooms"],
+        bathrooms=user_row["Bathrooms"],
+        description=user_row["Qualitative Description"],
     )
 
-    return user_text
-
 
 def property_to_text(property_row):
     """
@@ -43,17 +50,61 @@ def property_to_text(property_row):
         str: Text representation of property characteristics
     """
 
-    price = property_row["Price"]
-    bedrooms = property_row["Bedrooms"]
-    bathrooms = property_row["Bathrooms"]
-    living_area = property_row["Living Area (sq ft)"]
-    description = property_row["Qualitative Description"]
-
-    property_text = (
-        f"This property is priced at {price} dollars, "
-        f"has {bedrooms} bedrooms and {bathrooms} bathrooms, "
-        f"with a living area of {living_area} square feet. "
-        f"Property description: {description}"
+    return PROPERTY_FMT.format(
+        price=property_row["Price"],
+        bedrooms=property_row["Bedrooms"],
+        bathrooms=property_row["Bathrooms"],
+        living_area=property_row["Living Area (sq ft)"],
+        description=property_row["Qualitative Description"],
     )
 
-    return property_text
+
+def users_to_texts(users_df):
+    """
+    Convert every user row into text without per-row Series construction.
+
+    Parameters:
+        users_df (pd.DataFrame): User preferences dataframe
+
+    Returns:
+        list[str]: Text representation of each user, in row order
+    """
+
+    return [
+        USER_FMT.format(budget=budget, bedrooms=bedrooms, bathrooms=bathrooms, description=description)
+        for budget, bedrooms, bathrooms, description in zip(
+            users_df["Budget"].to_numpy(),
+            users_df["Bedrooms"].to_numpy(),
+            users_df["Bathrooms"].to_numpy(),
+            users_df["Qualitative Description"].to_numpy(),
+        )
+    ]
+
+
+def properties_to_texts(properties_df):
+    """
+    Convert every property row into text without per-row Series construction.
+
+    Parameters:
+        properties_df (pd.DataFrame): Property characteristics dataframe
+
+    Returns:
+        list[str]: Text representation of each property, in row order
+    """
+
+    return [
+        PROPERTY_FMT.format(
+            price=price,
+            bedrooms=bedrooms,
+            bathrooms=bathrooms,
+            living_area=living_area,
+            description=description,
+        )
+        for price, bedrooms, bathrooms, living_area, description in zip(
+            properties_df["Price"].to_numpy(),
+            properties_df["Bedrooms"].to_numpy(),
+            properties_df["Bathrooms"].to_numpy(),
+            properties_df["Living Area (sq ft)"].to_numpy(),
+            properties_df["Qualitative Description"].to_numpy(),
+        )
+    ]
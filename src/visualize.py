@@ -6,188 +6,704 @@ including heatmaps, distribution plots, and summary statistics.
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import seaborn as sns
+from numba import njit
+from PIL import Image
 
+# Output resolution; figures are laid out with tight_layout, so the extra
+# measuring pass of bbox_inches='tight' is skipped
+DPI = 150
+BBOX = None
 
-def plot_similarity_heatmap(csv_path, save_path):
+# zlib level 1 encodes PNGs several times faster than the default level 6 for
+# slightly larger files
+PNG_PIL_KWARGS = {'compress_level': 1, 'optimize': False}
+
+# Largest heatmap (in cells) that still gets per-cell score annotations
+HEATMAP_ANNOT_MAX_CELLS = 400
+
+# Heatmaps larger than this (in cells) are drawn with imshow instead of seaborn
+HEATMAP_IMSHOW_MIN_CELLS = 2000
+
+# Heatmaps are block-averaged down to at most this many cells per axis
+HEATMAP_MAX_CELLS_PER_AXIS = 500
+
+# Results CSVs at least this large (in bytes) are aggregated chunk by chunk
+# instead of being loaded whole; the heatmap is skipped for them
+STREAMING_MIN_BYTES = 1 << 30
+STREAMING_CHUNK_ROWS = 1_000_000
+
+# Score range and resolution (scores are rounded to 2 decimals) of the
+# streaming score histogram
+_SCORE_MIN, _SCORE_MAX, _SCORE_STEP = -100.0, 100.0, 0.01
+
+# Results with at least this many rows have their figures drawn in parallel
+# worker processes; below it, process startup costs more than it saves
+PARALLEL_PLOTS_MIN_ROWS = 10_000
+
+# Number of bins in the score distribution plot
+SCORE_BINS = 30
+
+# Column types of the recommendations CSV
+_SCHEMA = {"user_id": "int32", "property_id": "int32", "match_score": "float32"}
+
+# Apply the style once at import, with the shared title/label fonts baked in
+# so the plot functions do not restyle every Text
+sns.set_theme(
+    context='notebook',
+    style='white',
+    font='DejaVu Sans',
+    rc={
+        'axes.titlesize': 16,
+        'axes.titleweight': 'bold',
+        'axes.titlepad': 20,
+        'axes.labelsize': 12,
+        'axes.labelweight': 'bold',
+    }
+)
+
+# Single figure reused by every plot (cleared and resized each time) so the
+# Agg canvas is not allocated and freed per figure
+_FIG = plt.figure(figsize=(14, 8))
+
+# Warm the font cache so the first plot does not pay for the font lookup
+_FIG.text(0, 0, 'warmup')
+_FIG.canvas.draw()
+_FIG.clf()
+
+
+def _read_results(csv_path):
+    """
+    Read a recommendations CSV with the multithreaded pyarrow parser.
+
+    The id columns are converted to categoricals so groupby and pivot work on
+    their integer codes. The parsed frame is cached in a sibling .parquet
+    file, which is read instead of the CSV while it is newer than the CSV.
+    """
+    parquet_path = csv_path + ".parquet"
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+        df = pd.read_parquet(parquet_path)
+    else:
+        df = pd.read_csv(csv_path, engine="pyarrow", dtype=_SCHEMA)
+        df.to_parquet(parquet_path)
+
+    df['user_id'] = df['user_id'].astype('category')
+    df['property_id'] = df['property_id'].astype('category')
+    return df
+
+
+def _as_dataframe(data):
+    """
+    Return data as a DataFrame, reading it from CSV if a path is given.
+    """
+    return data if isinstance(data, pd.DataFrame) else _read_results(data)
+
+
+@njit(cache=True, fastmath=True)
+def _uniform_hist(values, lo, hi, n_bins):
+    """
+    Count values into n_bins equal-width bins over [lo, hi].
+
+    Bin index is computed directly instead of by binary search; like
+    np.histogram, the last bin includes the right edge. values must not
+    contain NaN.
+    """
+    counts = np.zeros(n_bins, np.int64)
+    inv_width = n_bins / (hi - lo)
+    for value in values:
+        i = int((value - lo) * inv_width)
+        if i == n_bins and value == hi:
+            i = n_bins - 1
+        if 0 <= i < n_bins:
+            counts[i] += 1
+    return counts
+
+
+def _accumulate_by_id(seen, sums, counts, ids, scores):
+    """
+    Add per-id score sums and counts of one chunk to the running totals.
+
+    seen is a pd.Index of the ids met so far, and position i of sums and
+    counts belongs to seen[i]. Ids are mapped to positions with get_indexer
+    and unseen ids are appended, so any id (large, negative, sparse) costs a
+    single slot. NaN scores are not counted, but still register their id.
+    """
+    codes = seen.get_indexer(ids)
+    new = codes < 0
+    if new.any():
+        seen = seen.append(pd.Index(pd.unique(ids[new])))
+        codes[new] = seen.get_indexer(ids[new])
+
+    n = len(seen)
+    valid = ~np.isnan(scores)
+    sums = np.pad(sums, (0, n - len(sums))) + np.bincount(codes[valid], weights=scores[valid], minlength=n)
+    counts = np.pad(counts, (0, n - len(counts))) + np.bincount(codes[valid], minlength=n)
+    return seen, sums, counts
+
+
+def _averages_from_totals(seen, sums, counts, id_col):
+    # Ids with no valid score average to NaN, as in _avg_by_id
+    with np.errstate(invalid='ignore', divide='ignore'):
+        averages = sums / counts
+    return pd.Series(
+        averages, index=pd.Index(seen, name=id_col), name='match_score'
+    ).sort_values(ascending=False)
+
+
+def _streaming_aggregate(csv_path, n_bins=SCORE_BINS):
+    """
+    Aggregate a recommendations CSV in one constant-memory pass over chunks.
+
+    Returns the score summary (see _score_summary) and the average score per
+    user and per property. Scores are counted into a histogram with one bin
+    per 0.01 step (the precision scores are rounded to), from which the median
+    and the plotted bins are derived.
+    """
+    # One fine bin centred on every representable score
+    n_fine = int(round((_SCORE_MAX - _SCORE_MIN) / _SCORE_STEP)) + 1
+    fine_lo, fine_hi = _SCORE_MIN - _SCORE_STEP / 2, _SCORE_MAX + _SCORE_STEP / 2
+    fine = np.zeros(n_fine, np.int64)
+    total, n_scores = 0.0, 0
+    lo, hi = np.inf, -np.inf
+    users = (pd.Index(np.zeros(0, np.int64)), np.zeros(0), np.zeros(0, np.int64))
+    properties = (pd.Index(np.zeros(0, np.int64)), np.zeros(0), np.zeros(0, np.int64))
+
+    chunks = pd.read_csv(csv_path, chunksize=STREAMING_CHUNK_ROWS, engine='c', dtype=_SCHEMA)
+    for chunk in chunks:
+        scores = chunk['match_score'].to_numpy(np.float64)
+        users = _accumulate_by_id(*users, chunk['user_id'].to_numpy(), scores)
+        properties = _accumulate_by_id(*properties, chunk['property_id'].to_numpy(), scores)
+
+        scores = scores[~np.isnan(scores)]
+        if not scores.size:
+            continue
+        fine += _uniform_hist(scores, fine_lo, fine_hi, n_fine)
+        total += scores.sum()
+        n_scores += scores.size
+        lo, hi = min(lo, scores.min()), max(hi, scores.max())
+
+    centers = _SCORE_MIN + np.arange(n_fine) * _SCORE_STEP
+    if n_scores:
+        # Median: mean of the two middle values, read off the cumulative counts
+        middle = np.searchsorted(np.cumsum(fine), [(n_scores - 1) // 2, n_scores // 2], side='right')
+        median = centers[middle].mean()
+    else:
+        lo, hi, median = 0.0, 1.0, np.nan
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+
+    # Re-bin the fine histogram into the plotted bins over the observed range
+    occupied = np.flatnonzero(fine)
+    coarse = ((centers[occupied] - lo) * (n_bins / (hi - lo))).astype(np.int64)
+    coarse = np.clip(coarse, 0, n_bins - 1)
+    counts = np.bincount(coarse, weights=fine[occupied], minlength=n_bins).astype(np.int64)
+
+    summary = {
+        'counts': counts,
+        'edges': np.linspace(lo, hi, n_bins + 1),
+        'mean': total / n_scores if n_scores else np.nan,
+        'median': median,
+    }
+    return (
+        summary,
+        _averages_from_totals(*users, 'user_id'),
+        _averages_from_totals(*properties, 'property_id'),
+    )
+
+
+def _score_summary(data, n_bins=SCORE_BINS):
+    """
+    Return the score histogram (counts, edges), mean and median as a dict.
+
+    data may already be such a summary (computed by _streaming_aggregate), in
+    which case it is returned unchanged.
+    """
+    if isinstance(data, dict):
+        return data
+    df = _as_dataframe(data)
+    scores = df['match_score'].to_numpy(np.float64)
+    scores = scores[~np.isnan(scores)]
+    lo, hi = (scores.min(), scores.max()) if scores.size else (0.0, 1.0)
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    return {
+        'counts': _uniform_hist(scores, lo, hi, n_bins),
+        'edges': np.linspace(lo, hi, n_bins + 1),
+        'mean': df['match_score'].mean(),
+        'median': df['match_score'].median(),
+    }
+
+
+def _avg_by_id(ids, scores):
+    """
+    Return the distinct ids and the mean score of each, ignoring NaN scores.
+
+    Scores are summed and counted per id with np.bincount over dense integer
+    codes: the category codes if ids is categorical, the ids themselves if
+    they are small non-negative integers, pd.factorize otherwise. Ids with no
+    valid score get NaN; missing ids are dropped.
+    """
+    values = ids.to_numpy()
+    if isinstance(ids.dtype, pd.CategoricalDtype):
+        codes, uniques = ids.cat.codes.to_numpy(), ids.cat.categories
+    elif (
+        np.issubdtype(values.dtype, np.integer) and values.size
+        and values.min() >= 0 and values.max() < max(4 * values.size, 1 << 16)
+    ):
+        codes, uniques = values, np.arange(values.max() + 1)
+    else:
+        codes, uniques = pd.factorize(values)
+    n = len(uniques)
+    codes = codes.astype(np.intp, copy=False)
+    scores = scores.to_numpy(np.float64)
+
+    # Missing ids have code -1
+    if n and codes.min() < 0:
+        keep = codes >= 0
+        codes, scores = codes[keep], scores[keep]
+
+    present = np.bincount(codes, minlength=n)
+    nan = np.isnan(scores)
+    if nan.any():
+        codes, scores = codes[~nan], scores[~nan]
+        counts = np.bincount(codes, minlength=n)
+    else:
+        counts = present
+    sums = np.bincount(codes, weights=scores, minlength=n)
+
+    present = present > 0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        averages = sums[present] / counts[present]
+    return uniques[present], averages
+
+
+def _average_scores(data, id_col):
+    """
+    Return mean match score per id, sorted in descending order.
+
+    data may already be such a Series (precomputed by visualize_all), in
+    which case it is returned unchanged.
+    """
+    if isinstance(data, pd.Series):
+        return data
+    df = _as_dataframe(data)
+    ids, averages = _avg_by_id(df[id_col], df['match_score'])
+    return pd.Series(
+        averages, index=pd.Index(ids, name=id_col), name='match_score'
+    ).sort_values(ascending=False)
+
+
+def _heatmap_data(df):
+    # Pivot: users vs properties (pairs are unique, so no aggregation needed)
+    return (
+        df.drop_duplicates(["user_id", "property_id"], keep="last")
+        .pivot(index="user_id", columns="property_id", values="match_score")
+        .fillna(0.0)
+    )
+
+
+def _block_mean(arr, max_per_axis):
+    """
+    Downsample a 2D array by averaging blocks so neither axis exceeds max_per_axis.
+
+    Returns the reduced array and the start index of each row and column block.
+    Trailing blocks may be smaller; np.add.reduceat sums every block, so no
+    rows or columns are dropped.
+    """
+    rows, cols = arr.shape
+    row_starts = np.arange(0, rows, int(np.ceil(rows / max_per_axis)))
+    col_starts = np.arange(0, cols, int(np.ceil(cols / max_per_axis)))
+
+    sums = np.add.reduceat(np.add.reduceat(arr, row_starts, axis=0), col_starts, axis=1)
+    row_sizes = np.diff(np.append(row_starts, rows))
+    col_sizes = np.diff(np.append(col_starts, cols))
+    return sums / np.outer(row_sizes, col_sizes), row_starts, col_starts
+
+
+def _draw_heatmap(ax, heatmap_data):
+    x_stride = max(1, heatmap_data.shape[1] // 50)
+    y_stride = max(1, heatmap_data.shape[0] // 50)
+
+    if heatmap_data.size > HEATMAP_IMSHOW_MIN_CELLS:
+        # Large matrices: draw the whole matrix as one image instead of per-cell
+        # meshes, block-averaged when it has more cells than can be displayed
+        values, row_starts, col_starts = _block_mean(heatmap_data.to_numpy(), HEATMAP_MAX_CELLS_PER_AXIS)
+        x_stride = max(1, len(col_starts) // 50)
+        y_stride = max(1, len(row_starts) // 50)
+
+        image = ax.imshow(
+            values,
+            aspect='auto',
+            cmap='YlOrRd',
+            interpolation='nearest'
+        )
+        image.set_rasterized(True)
+        ax.figure.colorbar(image, ax=ax, label='Match Score')
+
+        # Label each tick with the first id in its block
+        ax.set_xticks(np.arange(0, len(col_starts), x_stride))
+        ax.set_xticklabels(heatmap_data.columns[col_starts[::x_stride]], rotation=90)
+        ax.set_yticks(np.arange(0, len(row_starts), y_stride))
+        ax.set_yticklabels(heatmap_data.index[row_starts[::y_stride]])
+    else:
+        # Per-cell annotations and every tick label only stay readable (and cheap
+        # to draw) on small matrices
+        annotate = heatmap_data.size <= HEATMAP_ANNOT_MAX_CELLS
+
+        # Create heatmap using seaborn for better visualization
+        sns.heatmap(
+            heatmap_data,
+            ax=ax,
+            annot=annotate,
+            fmt='.1f',
+            xticklabels=x_stride,
+            yticklabels=y_stride,
+            cmap='YlOrRd',
+            cbar_kws={'label': 'Match Score'},
+            linewidths=0.5,
+            linecolor='gray'
+        )
+        # Rasterize the cell mesh once; text and axes stay vector
+        ax.collections[0].set_rasterized(True)
+
+    ax.set_title("User–Property Similarity Heatmap")
+    ax.set_xlabel("Property ID")
+    ax.set_ylabel("User ID")
+
+
+def _draw_score_distribution(ax, summary):
+    edges = summary['edges']
+    
+    ax.bar(edges[:-1], summary['counts'], width=np.diff(edges), align='edge', color='steelblue', edgecolor='black', alpha=0.7)
+    
+    ax.set_title("Distribution of Match Scores")
+    ax.set_xlabel("Match Score")
+    ax.set_ylabel("Frequency")
+    ax.grid(axis='y', alpha=0.3)
+    
+    # Add statistics
+    mean_score = summary['mean']
+    median_score = summary['median']
+    ax.axvline(mean_score, color='red', linestyle='--', linewidth=2, label=f'Mean: {mean_score:.2f}')
+    ax.axvline(median_score, color='green', linestyle='--', linewidth=2, label=f'Median: {median_score:.2f}')
+    ax.legend()
+
+
+@lru_cache(maxsize=8)
+def _str_labels(ids):
+    """
+    Return a tuple of ids as an array of string tick labels.
+
+    Cached so repeated plots of the same ids (e.g. dashboard refreshes) skip
+    the conversion.
+    """
+    return np.asarray(ids).astype(str)
+
+
+def _draw_average_scores(ax, averages, title, xlabel, palette):
+    # Color code by score (palette = high, medium, low)
+    high, medium, low = palette
+    scores = averages.to_numpy()
+    colors = np.where(scores >= 80, high, np.where(scores >= 60, medium, low))
+    
+    ax.bar(_str_labels(tuple(averages.index)), scores, color=colors, edgecolor='black', alpha=0.7)
+    
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel("Average Match Score")
+    ax.set_ylim(0, 100)
+    ax.grid(axis='y', alpha=0.3)
+
+
+def _draw_user_average_scores(ax, user_avg):
+    _draw_average_scores(ax, user_avg, "Average Match Score per User", "User ID", ('green', 'orange', 'red'))
+
+
+def _draw_property_average_scores(ax, property_avg):
+    _draw_average_scores(
+        ax, property_avg, "Average Match Score per Property", "Property ID", ('darkgreen', 'orange', 'darkred')
+    )
+
+
+def _new_figure(figsize):
+    _FIG.clf()
+    _FIG.set_size_inches(figsize)
+    return _FIG
+
+
+def _up_to_date(out, src):
+    """
+    Return True if the figure out exists and is at least as new as src.
+    """
+    return os.path.exists(out) and os.path.getmtime(out) >= os.path.getmtime(src)
+
+
+def _skip_plot(data, save_path, force):
+    """
+    Return True, after reporting it, if save_path need not be regenerated.
+
+    Only applies when data is a CSV path; loaded data has no mtime to
+    compare against.
+    """
+    if force or not isinstance(data, str) or not _up_to_date(save_path, data):
+        return False
+    print(f"⏭️ Up to date, skipping: {save_path}")
+    return True
+
+
+def _save_figure(fig, save_path):
+    directory = os.path.dirname(save_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # pil_kwargs is only understood by the PNG writer
+    png = {'pil_kwargs': PNG_PIL_KWARGS} if save_path.lower().endswith('.png') else {}
+    fig.savefig(save_path, dpi=DPI, bbox_inches=BBOX, **png)
+
+
+def _write_heatmap_image(heatmap_data, save_path):
+    """
+    Write the heatmap as a bare PNG with one pixel per cell.
+
+    The colormap is applied to the whole array at once and the result is
+    encoded directly with Pillow, bypassing matplotlib's figure and renderer.
+    There are no axes, labels or colorbar.
+    """
+    arr = heatmap_data.to_numpy(np.float32)
+    lo = arr.min() if arr.size else 0.0
+    span = np.ptp(arr) if arr.size else 0.0
+    norm = (arr - lo) / (span or 1.0)
+    rgb = (plt.get_cmap('YlOrRd')(norm)[..., :3] * 255).astype(np.uint8)
+
+    directory = os.path.dirname(save_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    Image.fromarray(rgb).save(save_path, **PNG_PIL_KWARGS)
+
+
+def plot_similarity_heatmap(data, save_path, fast=False, force=False):
     """
     Create and save a heatmap of user–property match scores.
 
     Parameters:
-        csv_path (str): Path to match score CSV
+        data (str | pd.DataFrame): Path to match score CSV, or the loaded results
         save_path (str): Path to save heatmap image
+        fast (bool): Write only the colormapped matrix (no axes or colorbar)
+            with Pillow instead of drawing a matplotlib figure
+        force (bool): Regenerate even if save_path is newer than the CSV
     """
 
-    # Load results
-    df = pd.read_csv(csv_path)
-
-    # Pivot table: users vs properties
-    heatmap_data = df.pivot_table(
-        index="user_id",
-        columns="property_id",
-        values="match_score",
-        fill_value=0
-    )
+    if _skip_plot(data, save_path, force):
+        return
 
-    # Create figure
-    plt.figure(figsize=(14, 8))
-    
-    # Create heatmap using seaborn for better visualization
-    sns.heatmap(
-        heatmap_data,
-        annot=True,
-        fmt='.1f',
-        cmap='YlOrRd',
-        cbar_kws={'label': 'Match Score'},
-        linewidths=0.5,
-        linecolor='gray'
-    )
+    # Load results
+    df = _as_dataframe(data)
 
-    plt.title("User–Property Similarity Heatmap", fontsize=16, fontweight='bold', pad=20)
-    plt.xlabel("Property ID", fontsize=12, fontweight='bold')
-    plt.ylabel("User ID", fontsize=12, fontweight='bold')
+    if fast:
+        _write_heatmap_image(_heatmap_data(df), save_path)
+        print(f"✅ Heatmap saved to: {save_path}")
+        return
 
-    plt.tight_layout()
+    # Create figure
+    fig = _new_figure((14, 8))
+    ax = fig.add_subplot(111)
+    _draw_heatmap(ax, _heatmap_data(df))
+    fig.tight_layout()
 
     # Save figure
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    _save_figure(fig, save_path)
     print(f"✅ Heatmap saved to: {save_path}")
-    plt.close()
 
 
-def plot_score_distribution(csv_path, output_dir="outputs/figures"):
+def plot_score_distribution(data, output_dir="outputs/figures", force=False):
     """
     Create and save a histogram of match score distribution.
 
     Parameters:
-        csv_path (str): Path to match score CSV
+        data (str | pd.DataFrame | dict): Path to match score CSV, the loaded
+            results, or a precomputed score summary
         output_dir (str): Directory to save figure
+        force (bool): Regenerate even if the figure is newer than the CSV
     """
     
-    df = pd.read_csv(csv_path)
-    
-    plt.figure(figsize=(10, 6))
-    
-    plt.hist(df['match_score'], bins=30, color='steelblue', edgecolor='black', alpha=0.7)
+    save_path = os.path.join(output_dir, 'score_distribution.png')
+    if _skip_plot(data, save_path, force):
+        return
     
-    plt.title("Distribution of Match Scores", fontsize=16, fontweight='bold', pad=20)
-    plt.xlabel("Match Score", fontsize=12, fontweight='bold')
-    plt.ylabel("Frequency", fontsize=12, fontweight='bold')
-    plt.grid(axis='y', alpha=0.3)
+    summary = _score_summary(data)
     
-    # Add statistics
-    mean_score = df['match_score'].mean()
-    median_score = df['match_score'].median()
-    plt.axvline(mean_score, color='red', linestyle='--', linewidth=2, label=f'Mean: {mean_score:.2f}')
-    plt.axvline(median_score, color='green', linestyle='--', linewidth=2, label=f'Median: {median_score:.2f}')
-    plt.legend()
+    fig = _new_figure((10, 6))
+    ax = fig.add_subplot(111)
+    _draw_score_distribution(ax, summary)
+    fig.tight_layout()
     
-    plt.tight_layout()
-    
-    os.makedirs(output_dir, exist_ok=True)
-    save_path = os.path.join(output_dir, 'score_distribution.png')
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    _save_figure(fig, save_path)
     print(f"✅ Score distribution saved to: {save_path}")
-    plt.close()
 
 
-def plot_user_average_scores(csv_path, output_dir="outputs/figures"):
+def plot_user_average_scores(data, output_dir="outputs/figures", force=False):
     """
     Create and save a bar plot of average match score per user.
 
     Parameters:
-        csv_path (str): Path to match score CSV
+        data (str | pd.DataFrame | pd.Series): Path to match score CSV, the loaded
+            results, or precomputed average score per user
         output_dir (str): Directory to save figure
+        force (bool): Regenerate even if the figure is newer than the CSV
     """
     
-    df = pd.read_csv(csv_path)
-    user_avg = df.groupby('user_id')['match_score'].mean().sort_values(ascending=False)
-    
-    plt.figure(figsize=(10, 6))
-    
-    bars = plt.bar(user_avg.index.astype(str), user_avg.values, edgecolor='black', alpha=0.7)
-    
-    # Color code by score
-    for bar, score in zip(bars, user_avg.values):
-        if score >= 80:
-            bar.set_color('green')
-        elif score >= 60:
-            bar.set_color('orange')
-        else:
-            bar.set_color('red')
+    save_path = os.path.join(output_dir, 'user_average_scores.png')
+    if _skip_plot(data, save_path, force):
+        return
     
-    plt.title("Average Match Score per User", fontsize=16, fontweight='bold', pad=20)
-    plt.xlabel("User ID", fontsize=12, fontweight='bold')
-    plt.ylabel("Average Match Score", fontsize=12, fontweight='bold')
-    plt.ylim(0, 100)
-    plt.grid(axis='y', alpha=0.3)
+    user_avg = _average_scores(data, 'user_id')
     
-    plt.tight_layout()
+    fig = _new_figure((10, 6))
+    ax = fig.add_subplot(111)
+    _draw_user_average_scores(ax, user_avg)
+    fig.tight_layout()
     
-    os.makedirs(output_dir, exist_ok=True)
-    save_path = os.path.join(output_dir, 'user_average_scores.png')
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    _save_figure(fig, save_path)
     print(f"✅ User average scores saved to: {save_path}")
-    plt.close()
 
 
-def plot_property_average_scores(csv_path, output_dir="outputs/figures"):
+def plot_property_average_scores(data, output_dir="outputs/figures", force=False):
     """
     Create and save a bar plot of average match score per property.
 
     Parameters:
-        csv_path (str): Path to match score CSV
+        data (str | pd.DataFrame | pd.Series): Path to match score CSV, the loaded
+            results, or precomputed average score per property
         output_dir (str): Directory to save figure
+        force (bool): Regenerate even if the figure is newer than the CSV
     """
     
-    df = pd.read_csv(csv_path)
-    property_avg = df.groupby('property_id')['match_score'].mean().sort_values(ascending=False)
-    
-    plt.figure(figsize=(10, 6))
-    
-    bars = plt.bar(property_avg.index.astype(str), property_avg.values, edgecolor='black', alpha=0.7)
-    
-    # Color code by score
-    for bar, score in zip(bars, property_avg.values):
-        if score >= 80:
-            bar.set_color('darkgreen')
-        elif score >= 60:
-            bar.set_color('orange')
-        else:
-            bar.set_color('darkred')
+    save_path = os.path.join(output_dir, 'property_average_scores.png')
+    if _skip_plot(data, save_path, force):
+        return
     
-    plt.title("Average Match Score per Property", fontsize=16, fontweight='bold', pad=20)
-    plt.xlabel("Property ID", fontsize=12, fontweight='bold')
-    plt.ylabel("Average Match Score", fontsize=12, fontweight='bold')
-    plt.ylim(0, 100)
-    plt.grid(axis='y', alpha=0.3)
+    property_avg = _average_scores(data, 'property_id')
     
-    plt.tight_layout()
+    fig = _new_figure((10, 6))
+    ax = fig.add_subplot(111)
+    _draw_property_average_scores(ax, property_avg)
+    fig.tight_layout()
     
-    os.makedirs(output_dir, exist_ok=True)
-    save_path = os.path.join(output_dir, 'property_average_scores.png')
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    _save_figure(fig, save_path)
     print(f"✅ Property average scores saved to: {save_path}")
-    plt.close()
 
 
-def visualize_all(csv_path="outputs/top_k_recommendations.csv", output_dir="outputs/figures"):
+def plot_dashboard(data, save_path, force=False):
+    """
+    Draw all four plots on one 2x2 figure and save it as a single image.
+
+    Parameters:
+        data (str | pd.DataFrame | tuple): Path to match score CSV, the loaded
+            results, or the (score summary, user averages, property averages)
+            of a streaming pass, in which case the heatmap panel is left empty
+        save_path (str): Path to save dashboard image
+        force (bool): Regenerate even if save_path is newer than the CSV
+    """
+
+    if _skip_plot(data, save_path, force):
+        return
+
+    if isinstance(data, tuple):
+        heatmap_data = None
+        summary, user_avg, property_avg = data
+    else:
+        df = _as_dataframe(data)
+        heatmap_data = _heatmap_data(df)
+        summary = _score_summary(df)
+        user_avg = _average_scores(df, 'user_id')
+        property_avg = _average_scores(df, 'property_id')
+
+    fig = _new_figure((20, 12))
+    (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
+    if heatmap_data is None:
+        ax1.axis('off')
+        ax1.text(0.5, 0.5, "Heatmap skipped for large results", ha='center', va='center')
+    else:
+        _draw_heatmap(ax1, heatmap_data)
+    _draw_score_distribution(ax2, summary)
+    _draw_user_average_scores(ax3, user_avg)
+    _draw_property_average_scores(ax4, property_avg)
+    fig.tight_layout()
+
+    _save_figure(fig, save_path)
+    print(f"✅ Dashboard saved to: {save_path}")
+
+
+def _render_one(job):
+    """
+    Draw one of the visualize_all figures (in a worker process for large results).
+    """
+    plot, data, target = job
+    plot(data, target)
+
+
+def visualize_all(
+    csv_path="outputs/top_k_recommendations.csv", output_dir="outputs/figures", combined=False, force=False
+):
     """
     Generate all visualizations from the results CSV.
 
+    Nothing is loaded or drawn if every figure is already newer than the CSV.
+
     Parameters:
         csv_path (str): Path to recommendations CSV
         output_dir (str): Directory to save all figures
+        combined (bool): Save a single dashboard image instead of four figures
+        force (bool): Regenerate the figures even if they are up to date
     """
     
+    streaming = os.path.getsize(csv_path) >= STREAMING_MIN_BYTES
+    if combined:
+        names = ['dashboard.png']
+    else:
+        names = ['score_distribution.png', 'user_average_scores.png', 'property_average_scores.png']
+        if not streaming:
+            names.append('user_property_heatmap.png')
+    if not force and all(_up_to_date(os.path.join(output_dir, name), csv_path) for name in names):
+        print(f"⏭️ Visualizations in {output_dir} are up to date, skipping")
+        return
+
     print("📊 Generating all visualizations...")
-    plot_similarity_heatmap(csv_path, os.path.join(output_dir, 'user_property_heatmap.png'))
-    plot_score_distribution(csv_path, output_dir)
-    plot_user_average_scores(csv_path, output_dir)
-    plot_property_average_scores(csv_path, output_dir)
+    if streaming:
+        # Too large to load whole: aggregate in chunks and skip the heatmap
+        df = None
+        aggregates = _streaming_aggregate(csv_path)
+        print("⚠️ Results too large for a heatmap; skipping it")
+    else:
+        df = _read_results(csv_path)
+        aggregates = (_score_summary(df), _average_scores(df, 'user_id'), _average_scores(df, 'property_id'))
+    summary, user_avg, property_avg = aggregates
+
+    if combined:
+        plot_dashboard(aggregates if df is None else df, os.path.join(output_dir, 'dashboard.png'))
+    else:
+        jobs = [
+            (plot_score_distribution, summary, output_dir),
+            (plot_user_average_scores, user_avg, output_dir),
+            (plot_property_average_scores, property_avg, output_dir),
+        ]
+        if df is not None:
+            jobs.insert(0, (plot_similarity_heatmap, df, os.path.join(output_dir, 'user_property_heatmap.png')))
+        # The figures are independent and rendering holds the GIL, so large
+        # results draw each one in its own process
+        parallel = (df is None or len(df) >= PARALLEL_PLOTS_MIN_ROWS) and (os.cpu_count() or 1) > 1
+        if parallel:
+            with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+                list(pool.map(_render_one, jobs))
+        else:
+            for job in jobs:
+                _render_one(job)
     print(f"✨ All visualizations saved to: {output_dir}")
 
 